@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 
 def setup_debug_environment() -> None:
     """Set up environment variables for debugging."""
-    # Enable debug mode
+    # Enable debug mode; the server reads PANOS_DEBUG when it starts and reconfigures logging to match
     os.environ["PANOS_DEBUG"] = "true"
 
     # Set test values if not already set
@@ -42,7 +42,7 @@ def main() -> int:
 
         return 0
     except Exception as e:
-        logger.error(f"Error starting server: {str(e)}")
+        logger.error("Error starting server: %s", e)
         return 1
 
 
@@ -8,20 +8,69 @@ credentials from environment variables PANOS_USER and PANOS_PASS.
 
 import asyncio
 import os
+import ssl
 import sys
-import xml.etree.ElementTree as ET
 
 import httpx
+from lxml import etree as ET
 
 # Suppress insecure request warnings
 
+# Credentials are read once from the environment at import time
+PANOS_HOST = os.environ.get("PANOS_HOST", "")
+PANOS_USER = os.environ.get("PANOS_USER", "")
+PANOS_PASS = os.environ.get("PANOS_PASS", "")
 
-async def generate_api_key() -> str | None:
-    """Generate an API key using environment variables."""
+# TLS context built once at import; firewall management interfaces commonly use self-signed certificates
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.check_hostname = False
+_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+_SSL_CONTEXT.minimum_version = ssl.TLSVersion.TLSv1_2
+
+# Shared HTTP client, created on first use so repeated calls reuse pooled connections
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use.
+
+    Returns:
+        The module-level httpx AsyncClient.
+
+    """
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            verify=_SSL_CONTEXT,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client if it was created."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+async def generate_api_key(client: httpx.AsyncClient | None = None) -> str | None:
+    """Generate an API key using environment variables.
+
+    Args:
+        client: Optional HTTP client to send the request with. Defaults to the
+            shared module-level client so repeated calls reuse its connections.
+
+    Returns:
+        The generated API key, or None if generation failed.
+
+    """
     # Get credentials from environment
-    hostname = os.environ.get("PANOS_HOST", "")
-    username = os.environ.get("PANOS_USER", "")
-    password = os.environ.get("PANOS_PASS", "")
+    hostname = PANOS_HOST
+    username = PANOS_USER
+    password = PANOS_PASS
 
     if not hostname or not username or not password:
         print("Error: Required environment variables not set.")
@@ -34,21 +83,34 @@ async def generate_api_key() -> str | None:
     url = f"https://{hostname}/api/"
     params = {"type": "keygen", "user": username, "password": password}
 
+    if client is None:
+        client = get_client()
+
     try:
-        # Make the API request
-        async with httpx.AsyncClient(verify=False) as client:
-            response = await client.get(url, params=params, timeout=30.0)
-
-            if response.status_code == 200:
-                # Parse the XML response
-                root = ET.fromstring(response.text)
-                status = root.get("status")
-
-                if status == "success":
-                    # Extract the API key
-                    key_element = root.find(".//key")
-                    if key_element is not None and key_element.text:
-                        api_key = key_element.text
+        # Make the API request and parse the XML response as it streams in
+        async with client.stream("GET", url, params=params, timeout=30.0) as response:
+            if response.status_code != 200:
+                await response.aread()
+                print(f"HTTP Error: {response.status_code}")
+                print(response.text)
+                return None
+
+            parser = ET.XMLPullParser(events=("start", "end"))
+            status = None
+            error = None
+
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    if event == "start":
+                        # The first start event is the <response> root carrying the status
+                        if status is None:
+                            status = elem.get("status") or ""
+                        continue
+
+                    if elem.tag == "key" and status == "success" and elem.text:
+                        # Stop reading as soon as the key element is complete
+                        api_key = elem.text
                         print("\nAPI Key generated successfully!")
                         print("\nAPI Key:")
                         print(f"{api_key}")
@@ -61,22 +123,26 @@ async def generate_api_key() -> str | None:
                         print("\nOr update your mcp_config.json:")
                         print(f'"PANOS_API_KEY": "{api_key}"')
                         return api_key
-                    else:
-                        print("Error: Could not find API key in response")
-                else:
-                    # Extract error message
-                    error = root.find(".//msg")
-                    if error is not None and error.text:
-                        print(f"Error: {error.text}")
-                    else:
-                        print("Unknown error occurred")
+
+                    if elem.tag == "msg" and error is None:
+                        error = elem.text
+
+                    # Release each completed element to keep memory flat
+                    elem.clear()
+
+            # Surface any syntax error in a truncated or malformed document
+            parser.close()
+
+            if status == "success":
+                print("Error: Could not find API key in response")
+            elif error:
+                print(f"Error: {error}")
             else:
-                print(f"HTTP Error: {response.status_code}")
-                print(response.text)
+                print("Unknown error occurred")
 
     except httpx.RequestError as e:
         print(f"Connection error: {str(e)}")
-    except ET.ParseError as e:
+    except ET.XMLSyntaxError as e:
         print(f"XML parsing error: {str(e)}")
     except Exception as e:
         print(f"Unexpected error: {str(e)}")
@@ -86,7 +152,10 @@ async def generate_api_key() -> str | None:
 
 async def main() -> None:
     """Main entry point for the script."""
-    await generate_api_key()
+    try:
+        await generate_api_key()
+    finally:
+        await close_client()
 
 
 if __name__ == "__main__":
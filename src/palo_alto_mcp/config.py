@@ -1,9 +1,14 @@
 """Configuration module for Palo Alto Networks MCP Server."""
 
 import os
+from functools import lru_cache
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Values accepted as "true" for boolean environment flags
+TRUTHY_VALUES = frozenset({"true", "1", "yes", "y", "on"})
+
 
 class Settings(BaseSettings):
     """Settings for the Palo Alto Networks MCP Server.
@@ -12,12 +17,16 @@ class Settings(BaseSettings):
         panos_hostname: Hostname or IP address of the Palo Alto Networks NGFW.
         panos_api_key: API key for authenticating with the Palo Alto Networks NGFW.
         debug: Enable debug logging.
+        max_concurrency: Maximum number of concurrent requests sent to the NGFW.
+        cache_ttl: Seconds to reuse config lookup results before fetching them again.
 
     """
 
     panos_hostname: str
     panos_api_key: str
     debug: bool = False
+    max_concurrency: int = Field(default=8, ge=1)
+    cache_ttl: float = Field(default=60.0, ge=0)
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -29,9 +38,12 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the application settings from environment variables.
 
+    The settings are loaded once and cached for the lifetime of the process.
+
     Returns:
         Settings object with configuration values.
 
@@ -46,7 +58,7 @@ def get_settings() -> Settings:
 
         # Get debug flag from environment variable
         debug_str = os.environ.get("PANOS_DEBUG", "false").lower()
-        debug = debug_str in ("true", "1", "yes", "y", "on")
+        debug = debug_str in TRUTHY_VALUES
 
         # Create Settings with explicit values to satisfy type checker
         if hostname and api_key:
@@ -68,6 +80,8 @@ def get_settings() -> Settings:
             "- PANOS_HOSTNAME: Hostname or IP address of the Palo Alto Networks NGFW\n"
             "- PANOS_API_KEY: API key for authenticating with the Palo Alto Networks NGFW\n"
             "Optional environment variables:\n"
-            "- PANOS_DEBUG: Set to 'true' to enable debug logging"
+            "- PANOS_DEBUG: Set to 'true' to enable debug logging\n"
+            "- PANOS_MAX_CONCURRENCY: Maximum number of concurrent requests to the NGFW (at least 1, default: 8)\n"
+            "- PANOS_CACHE_TTL: Seconds to cache config lookups, 0 to disable (default: 60)"
         )
         raise ValueError(error_msg) from e
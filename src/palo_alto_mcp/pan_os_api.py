@@ -1,10 +1,13 @@
 """Palo Alto Networks XML API client module."""
 
+import asyncio
 import logging
-import xml.etree.ElementTree as ElementTree
-from typing import TypeVar
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypedDict, TypeVar, cast
 
 import httpx
+from lxml import etree
 
 from palo_alto_mcp.config import Settings
 
@@ -12,6 +15,78 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Request parameters for the fixed lookups, built once at import rather than on every call
+_SYSTEM_INFO_PARAMS = {"type": "op", "cmd": "<show><system><info></info></system></show>"}
+_SHARED_ADDRESS_PARAMS = {"type": "config", "action": "get", "xpath": "/config/shared/address"}
+_DEVICE_GROUP_PARAMS = {"type": "config", "action": "get", "xpath": "/config/devices/entry/device-group"}
+_VSYS_ADDRESS_PARAMS = {"type": "config", "action": "get", "xpath": "/config/devices/entry/vsys/entry/address"}
+_SECURITY_ZONE_PARAMS = {"type": "config", "action": "get", "xpath": "/config/devices/entry/vsys/entry/zone"}
+_SECURITY_POLICY_PARAMS = {
+    "type": "config",
+    "action": "get",
+    "xpath": "/config/devices/entry/vsys/entry/rulebase/security/rules",
+}
+
+# Transient failures (timeouts, dropped connections, 5xx) are retried with exponential backoff
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.2
+
+# Config lookups change on human timescales, so their parsed results are reused for a short time.
+# Entries are keyed by (hostname, lookup name) and hold (expiry time, result); the TTL comes from settings.
+_cache: dict[tuple[str, str], tuple[float, Any]] = {}
+
+
+def invalidate(hostname: str | None = None) -> None:
+    """Drop cached config lookups, e.g. after a commit.
+
+    Args:
+        hostname: Only drop entries for this host. Drops all entries if not given.
+
+    """
+    if hostname is None:
+        _cache.clear()
+        return
+    for key in [key for key in _cache if key[0] == hostname]:
+        del _cache[key]
+
+
+# Security policy fields, compiled once instead of on every entry. The member paths return a list of the
+# member texts directly (empty members have no text node), and string() yields "" for a missing field.
+_POLICY_SOURCE_ZONES = etree.XPath("from/member/text()", smart_strings=False)
+_POLICY_SOURCE_ADDRESSES = etree.XPath("source/member/text()", smart_strings=False)
+_POLICY_DESTINATION_ZONES = etree.XPath("to/member/text()", smart_strings=False)
+_POLICY_DESTINATION_ADDRESSES = etree.XPath("destination/member/text()", smart_strings=False)
+_POLICY_APPLICATIONS = etree.XPath("application/member/text()", smart_strings=False)
+_POLICY_SERVICES = etree.XPath("service/member/text()", smart_strings=False)
+_POLICY_ACTION = etree.XPath("string(action)", smart_strings=False)
+_POLICY_DESCRIPTION = etree.XPath("string(description)", smart_strings=False)
+
+
+class SecurityPolicy(TypedDict):
+    """A security policy rule as returned by PanOSAPIClient.get_security_policies.
+
+    Member fields hold one string per <member> element, in config order, and are
+    empty if the rule has none. Missing action and description fields are "".
+
+    """
+
+    name: str
+    source_zones: list[str]
+    source_addresses: list[str]
+    destination_zones: list[str]
+    destination_addresses: list[str]
+    applications: list[str]
+    services: list[str]
+    action: str
+    description: str
+
+
+# Address object types that carry the object's value
+_ADDRESS_TYPES = frozenset({"ip-netmask", "ip-range", "fqdn"})
+
+# Zone types that can appear under a zone's <network> element
+_ZONE_TYPES = frozenset({"layer3", "layer2", "virtual-wire", "tap", "external"})
+
 
 class PanOSAPIClient:
     """Client for interacting with the Palo Alto Networks XML API.
@@ -22,21 +97,80 @@ class PanOSAPIClient:
     Attributes:
         hostname: The hostname or IP address of the NGFW.
         api_key: The API key for authenticating with the NGFW.
-        client: An httpx AsyncClient for making HTTP requests.
+        cache_ttl: Seconds to reuse config lookup results before fetching them again.
+        client: The httpx AsyncClient used for making HTTP requests.
 
     """
 
-    def __init__(self: "PanOSAPIClient", settings: Settings) -> None:
+    def __init__(
+        self: "PanOSAPIClient",
+        settings: Settings,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         """Initialize the PanOSAPIClient.
 
         Args:
             settings: Application settings containing NGFW connection information.
+            transport: Optional httpx transport for the HTTP client, e.g. a mock transport in tests.
 
         """
         self.hostname = settings.panos_hostname
         self.api_key = settings.panos_api_key
+        self.cache_ttl = settings.cache_ttl
         self.base_url = f"https://{self.hostname}/api/"
-        self.client = httpx.AsyncClient(verify=False)  # In production, use proper cert verification
+        self._max_concurrency = settings.max_concurrency
+        self._transport = transport
+        # Reused for every response. Parsing is synchronous, so concurrent requests never interleave on it.
+        self._parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False, collect_ids=False, huge_tree=True)
+
+        # The HTTP client, request semaphore and cache locks belong to the event loop they were created on,
+        # so they are created on first use and replaced if the client is later used from another loop
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._cache_locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+    def _bind_loop(self: "PanOSAPIClient") -> httpx.AsyncClient:
+        """Make sure the loop-bound state belongs to the running event loop.
+
+        The HTTP client is created on first use, or again if it has been closed. If the running
+        loop has changed, the previous loop's client, semaphore and cache locks are discarded;
+        the old client cannot be closed from here because its loop is gone.
+
+        Returns:
+            The httpx AsyncClient bound to the running event loop.
+
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._client = None
+            # Caps in-flight requests so concurrent lookups don't trip the management plane's rate limiting
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._cache_locks = {}
+
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                verify=False,  # In production, use proper cert verification
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0),
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                transport=self._transport,
+            )
+        return self._client
+
+    @property
+    def client(self: "PanOSAPIClient") -> httpx.AsyncClient:
+        """The HTTP client for the running event loop, created on first use.
+
+        Connections are pooled on this client and reused by every request the
+        instance makes; call close() on shutdown to release them.
+
+        Returns:
+            The httpx AsyncClient bound to the running event loop.
+
+        """
+        return self._bind_loop()
 
     async def __aenter__(self: "PanOSAPIClient") -> "PanOSAPIClient":
         """Async context manager entry.
@@ -64,39 +198,111 @@ class PanOSAPIClient:
         await self.close()
 
     async def close(self: "PanOSAPIClient") -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client and its pooled connections.
+
+        The client is created again on next use, so closing is safe at any time.
+
+        """
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
 
-    async def _make_request(self: "PanOSAPIClient", params: dict[str, str]) -> ElementTree.Element:
+    async def _cached(self: "PanOSAPIClient", name: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Return a cached lookup result, calling fetch on a miss or after expiry.
+
+        Concurrent misses for the same lookup share a lock, so only one request
+        is sent to the firewall while the others wait for its result. Only a
+        result that fetch returns is stored; if it raises, nothing is cached.
+
+        Args:
+            name: Name of the lookup, used with the hostname as the cache key.
+            fetch: Coroutine function that retrieves a fresh result.
+
+        Returns:
+            The cached or freshly fetched result.
+
+        """
+        key = (self.hostname, name)
+        hit = _cache.get(key)
+        # Each key is only ever stored by the lookup that reads it, so the value has the fetch result's type
+        if hit is not None and hit[0] > time.monotonic():
+            return cast(T, hit[1])
+
+        self._bind_loop()
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            hit = _cache.get(key)
+            if hit is not None and hit[0] > time.monotonic():
+                return cast(T, hit[1])
+
+            result = await fetch()
+            _cache[key] = (time.monotonic() + self.cache_ttl, result)
+            return result
+
+    async def _retry(self: "PanOSAPIClient", fetch: Callable[[], Awaitable[T]]) -> T:
+        """Call fetch, retrying with exponential backoff on transient HTTP failures.
+
+        Only transport errors (timeouts, dropped connections) and 5xx responses are
+        retried; API errors and 4xx responses are raised immediately.
+
+        Args:
+            fetch: Coroutine function that performs the lookup from scratch.
+
+        Returns:
+            The result of the first successful call.
+
+        Raises:
+            httpx.HTTPError: If the last attempt still fails.
+
+        """
+        for attempt in range(RETRY_ATTEMPTS - 1):
+            try:
+                return await fetch()
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500:
+                    raise
+                delay = RETRY_BASE_DELAY * 2**attempt
+                logger.warning("Request failed (%s), retrying in %.1fs", e, delay)
+                await asyncio.sleep(delay)
+
+        return await fetch()
+
+    async def _make_request(self: "PanOSAPIClient", params: dict[str, str]) -> etree._Element:
         """Make a request to the Palo Alto Networks XML API.
 
         Args:
             params: Dictionary of query parameters to include in the request.
 
         Returns:
-            The XML response as an ElementTree Element.
+            The XML response as an lxml Element.
 
         Raises:
             httpx.HTTPError: If the HTTP request fails.
             ValueError: If the API returns an error response.
 
         """
-        # Add the API key to the parameters
-        params["key"] = self.api_key
+        # Log before the API key is added so it never reaches the logs
+        logger.debug("Making API request to %s with params: %s", self.base_url, params)
+
+        # Add the API key to a copy of the parameters, leaving the shared constants untouched
+        params = {**params, "key": self.api_key}
 
         try:
-            logger.debug(f"Making API request to {self.base_url} with params: {params}")
-            response = await self.client.get(self.base_url, params=params, timeout=30.0)
+            # Resolve the client first, as it rebinds the semaphore when the event loop has changed
+            client = self.client
+            async with self._semaphore:
+                response = await client.get(self.base_url, params=params)
             response.raise_for_status()
 
-            # Parse the XML response
-            response_text = response.text
-            if not response_text:
+            # Parse the raw response bytes; decoding to str first would only be re-encoded by the parser
+            body = response.content
+            if not body:
                 raise ValueError("Empty response from API")
 
-            logger.debug(f"Received response: {response_text[:200]}..." if len(response_text) > 200 else response_text)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received response: %s", body[:200].decode("utf-8", "replace"))
 
-            root = ElementTree.fromstring(response_text)
+            root = etree.fromstring(body, parser=self._parser)
 
             # Check for API errors
             status = root.get("status")
@@ -109,14 +315,83 @@ class PanOSAPIClient:
 
             return root
         except httpx.HTTPError as e:
-            logger.error(f"HTTP error: {str(e)}")
-            raise httpx.HTTPError(f"HTTP error: {str(e)}") from e
-        except ElementTree.ParseError as e:
-            logger.error(f"XML parsing error: {str(e)}")
+            logger.error("HTTP error: %s", e)
+            raise
+        except etree.XMLSyntaxError as e:
+            logger.error("XML parsing error: %s", e)
+            raise ValueError(f"Failed to parse XML response: {str(e)}") from e
+
+    async def _iter_entries(
+        self: "PanOSAPIClient",
+        params: dict[str, str],
+        container_tag: str,
+    ) -> AsyncIterator[etree._Element]:
+        """Stream the <entry> elements directly under container_tag from an API response.
+
+        The response body is parsed incrementally as it arrives, and each entry is cleared once
+        the caller has processed it, so peak memory stays at about one entry rather than the whole
+        document.
+
+        Args:
+            params: Dictionary of query parameters to include in the request.
+            container_tag: Tag of the element whose <entry> children are yielded.
+
+        Yields:
+            Each matching entry element, fully parsed.
+
+        Raises:
+            httpx.HTTPError: If the HTTP request fails.
+            ValueError: If the API returns an error response or the XML cannot be parsed.
+
+        """
+        # Log before the API key is added so it never reaches the logs
+        logger.debug("Streaming API request to %s with params: %s", self.base_url, params)
+
+        params = {**params, "key": self.api_key}
+        parser = etree.XMLPullParser(
+            events=("start", "end"),
+            remove_blank_text=True,
+            resolve_entities=False,
+            collect_ids=False,
+            huge_tree=True,
+        )
+        status = None
+        error_msg = "Unknown error"
+
+        try:
+            # Resolve the client first, as it rebinds the semaphore when the event loop has changed
+            client = self.client
+            async with self._semaphore, client.stream("GET", self.base_url, params=params) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    parser.feed(chunk)
+                    for event, elem in parser.read_events():
+                        # The first event is the start of the <response> root, which carries the status
+                        if status is None:
+                            status = elem.get("status") or ""
+                        elif event != "end":
+                            continue
+                        elif status != "success":
+                            if elem.tag == "msg" and elem.text:
+                                error_msg = elem.text
+                        elif elem.tag == "entry" and (parent := elem.getparent()) is not None and parent.tag == container_tag:
+                            yield elem
+                            # Drop the processed entry and any earlier siblings so the tree does not grow
+                            elem.clear(keep_tail=True)
+                            while elem.getprevious() is not None:
+                                del parent[0]
+                parser.close()
+        except httpx.HTTPError as e:
+            logger.error("HTTP error: %s", e)
+            raise
+        except etree.XMLSyntaxError as e:
+            logger.error("XML parsing error: %s", e)
             raise ValueError(f"Failed to parse XML response: {str(e)}") from e
-        except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
-            raise Exception(f"Unexpected error: {str(e)}") from e
+
+        if status is None:
+            raise ValueError("Empty response from API")
+        if status != "success":
+            raise ValueError(f"API error: {error_msg}")
 
     async def get_system_info(self: "PanOSAPIClient") -> dict[str, str]:
         """Get system information from the firewall.
@@ -125,11 +400,8 @@ class PanOSAPIClient:
             Dictionary containing system information.
 
         """
-        # Use the correct XML command format that works with this firewall
-        params = {"type": "op", "cmd": "<show><system><info></info></system></show>"}
-
-        root = await self._make_request(params)
-        result = root.find(".//result")
+        root = await self._make_request(_SYSTEM_INFO_PARAMS)
+        result = root.find("result")
 
         if result is None:
             raise ValueError("No system information found in response")
@@ -141,17 +413,11 @@ class PanOSAPIClient:
         system_elem = result.find("system")
         if system_elem is not None:
             for child in system_elem:
-                if child.text is not None:
-                    system_info[child.tag] = child.text
-                else:
-                    system_info[child.tag] = ""
+                system_info[child.tag] = child.text or ""
         else:
             # Handle the case where result contains the system info directly
             for child in result:
-                if child.text is not None:
-                    system_info[child.tag] = child.text
-                else:
-                    system_info[child.tag] = ""
+                system_info[child.tag] = child.text or ""
 
         # If no system info was found, add a default message
         if not system_info:
@@ -162,113 +428,144 @@ class PanOSAPIClient:
     async def get_address_objects(self: "PanOSAPIClient") -> list[dict[str, str]]:
         """Get address objects configured on the firewall.
 
+        Results are cached for cache_ttl seconds; see invalidate().
+
         Returns:
             List of dictionaries containing address object information.
             Each dictionary contains name, type, value, and optionally description and location.
 
         """
-        address_objects = []
+        return await self._cached("address_objects", self._fetch_address_objects)
+
+    async def _fetch_address_objects(self: "PanOSAPIClient") -> list[dict[str, str]]:
+        """Fetch address objects from the firewall, bypassing the cache.
+
+        Returns:
+            List of dictionaries containing address object information.
+            Each dictionary contains name, type, value, and optionally description and location.
+
+        Raises:
+            httpx.HTTPError: If any section's HTTP request fails.
+            ValueError: If the API returns an error response for the shared or device group lookup.
+
+        """
         logger.info("Retrieving address objects from Panorama")
 
-        # 1. Get shared address objects
-        shared_params = {"type": "config", "action": "get", "xpath": "/config/shared/address"}
-        try:
-            logger.info("Retrieving shared address objects")
-            root = await self._make_request(shared_params)
+        # The shared, device group and vsys lookups are independent, so run them concurrently. Each
+        # section retries its own request, and any failure propagates so a partial result is never cached.
+        sections = await asyncio.gather(
+            self._fetch_shared_address_objects(),
+            self._fetch_device_group_address_objects(),
+            self._fetch_vsys_address_objects(),
+        )
+        address_objects = [address_obj for section in sections for address_obj in section]
 
-            # Log the structure of the response for debugging
-            logger.debug(f"Shared address response structure: {ElementTree.tostring(root, encoding='unicode')[:200]}...")
+        logger.info("Total address objects found: %d", len(address_objects))
+        return address_objects
 
-            shared_entries = root.findall(".//entry")
-            logger.info(f"Found {len(shared_entries)} shared address objects")
+    async def _fetch_shared_address_objects(self: "PanOSAPIClient") -> list[dict[str, str]]:
+        """Fetch shared address objects.
 
-            for entry in shared_entries:
-                address_obj = {"name": entry.get("name") or "", "location": "shared"}
+        Returns:
+            List of address object dictionaries.
 
-                # Process the address object
-                address_objects.append(self._process_address_entry(entry, address_obj))
+        Raises:
+            httpx.HTTPError: If the HTTP request fails.
+            ValueError: If the API returns an error response.
 
-        except Exception as e:
-            logger.error(f"Error retrieving shared address objects: {str(e)}")
+        """
+        logger.info("Retrieving shared address objects")
+        address_objects = await self._retry(lambda: self._stream_address_objects(_SHARED_ADDRESS_PARAMS, "shared"))
+        logger.info("Found %d shared address objects", len(address_objects))
+        return address_objects
 
-        # 2. Get device group address objects
-        try:
-            # First, get the list of device groups
-            logger.info("Retrieving device groups")
-            dg_list_params = {"type": "config", "action": "get", "xpath": "/config/devices/entry/device-group"}
-            dg_root = await self._make_request(dg_list_params)
-
-            # Log the structure of the response for debugging
-            logger.debug(f"Device group response structure: {ElementTree.tostring(dg_root, encoding='unicode')[:200]}...")
-
-            device_groups = dg_root.findall(".//entry")
-            logger.info(f"Found {len(device_groups)} device groups")
-
-            for dg in device_groups:
-                dg_name = dg.get("name")
-                if not dg_name:
-                    continue
-
-                logger.info(f"Retrieving address objects for device group '{dg_name}'")
-                # Get addresses for this device group
-                dg_addr_params = {
-                    "type": "config",
-                    "action": "get",
-                    "xpath": f"/config/devices/entry/device-group/entry[@name='{dg_name}']/address",
-                }
+    async def _fetch_device_group_address_objects(self: "PanOSAPIClient") -> list[dict[str, str]]:
+        """Fetch address objects from every Panorama device group.
 
-                try:
-                    dg_addr_root = await self._make_request(dg_addr_params)
+        The device group config already contains each group's address objects, so they
+        are read from that single response rather than requested per device group.
 
-                    # Log the structure of the response for debugging
-                    logger.debug(
-                        f"Device group '{dg_name}' address response: "
-                        f"{ElementTree.tostring(dg_addr_root, encoding='unicode')[:200]}..."
-                    )
+        Returns:
+            List of address object dictionaries.
 
-                    dg_entries = dg_addr_root.findall(".//entry")
-                    logger.info(f"Found {len(dg_entries)} address objects in device group '{dg_name}'")
+        Raises:
+            httpx.HTTPError: If the HTTP request fails.
+            ValueError: If the API returns an error response.
+
+        """
+        logger.info("Retrieving device groups")
+        dg_root = await self._retry(lambda: self._make_request(_DEVICE_GROUP_PARAMS))
 
-                    for entry in dg_entries:
-                        address_obj = {"name": entry.get("name") or "", "location": f"device-group:{dg_name}"}
+        device_groups = dg_root.findall("result/device-group/entry")
+        logger.info("Found %d device groups", len(device_groups))
 
-                        # Process the address object
-                        address_objects.append(self._process_address_entry(entry, address_obj))
+        address_objects = []
+        for dg in device_groups:
+            dg_name = dg.get("name")
+            if not dg_name:
+                continue
+
+            dg_entries = dg.findall("address/entry")
+            logger.debug("Found %d address objects in device group '%s'", len(dg_entries), dg_name)
+
+            location = f"device-group:{dg_name}"
+            address_objects.extend(
+                [
+                    self._process_address_entry(entry, {"name": entry.get("name") or "", "location": location})
+                    for entry in dg_entries
+                ]
+            )
+
+        return address_objects
 
-                except Exception as e:
-                    logger.error(f"Error retrieving address objects for device group '{dg_name}': {str(e)}")
+    async def _fetch_vsys_address_objects(self: "PanOSAPIClient") -> list[dict[str, str]]:
+        """Fetch vsys address objects (for backward compatibility with firewalls).
 
-        except Exception as e:
-            logger.error(f"Error retrieving device groups: {str(e)}")
+        Returns:
+            List of address object dictionaries, empty if the API rejects the lookup.
 
-        # 3. Get vsys address objects (for backward compatibility with firewalls)
+        Raises:
+            httpx.HTTPError: If the HTTP request fails.
+
+        """
+        address_objects = []
         logger.info("Retrieving vsys address objects (for backward compatibility)")
-        vsys_params = {"type": "config", "action": "get", "xpath": "/config/devices/entry/vsys/entry/address"}
         try:
-            root = await self._make_request(vsys_params)
-            vsys_entries = root.findall(".//entry")
-            logger.info(f"Found {len(vsys_entries)} vsys address objects")
+            # The response holds only the matched <address> nodes, not the vsys they belong to,
+            # so the vsys name is reported as unknown
+            address_objects = await self._retry(lambda: self._stream_address_objects(_VSYS_ADDRESS_PARAMS, "vsys:unknown"))
+            logger.info("Found %d vsys address objects", len(address_objects))
 
-            # Find vsys name from the xpath rather than parent reference
-            # since standard ElementTree doesn't have getparent()
-            for entry in vsys_entries:
-                # Default to "unknown" if we can't determine the vsys name
-                vsys_name = "unknown"
-                address_obj = {"name": entry.get("name") or "", "location": f"vsys:{vsys_name}"}
+        except ValueError as e:
+            # Panorama has no vsys config and answers with an API error, which is expected.
+            # HTTP failures still propagate so a partial result is never cached.
+            logger.debug("Note: vsys address objects retrieval: %s", e)
 
-                # Process the address object
-                address_objects.append(self._process_address_entry(entry, address_obj))
+        return address_objects
 
-        except Exception as e:
-            # This might fail on Panorama, which is expected
-            logger.debug(f"Note: vsys address objects retrieval: {str(e)}")
+    async def _stream_address_objects(
+        self: "PanOSAPIClient",
+        params: dict[str, str],
+        location: str,
+    ) -> list[dict[str, str]]:
+        """Stream the address entries of a config lookup into address object dictionaries.
 
-        logger.info(f"Total address objects found: {len(address_objects)}")
-        return address_objects
+        Args:
+            params: Dictionary of query parameters for the address lookup.
+            location: Location to record on each address object.
+
+        Returns:
+            List of address object dictionaries.
+
+        """
+        return [
+            self._process_address_entry(entry, {"name": entry.get("name") or "", "location": location})
+            async for entry in self._iter_entries(params, "address")
+        ]
 
     def _process_address_entry(
         self: "PanOSAPIClient",
-        entry: ElementTree.Element,
+        entry: etree._Element,
         address_obj: dict[str, str],
     ) -> dict[str, str]:
         """Process an address entry XML element and extract its properties.
@@ -280,34 +577,17 @@ class PanOSAPIClient:
         Returns:
             Fully populated address object dictionary
         """
-        # Check for different address types
-        ip_netmask = entry.find("ip-netmask")
-        if ip_netmask is not None and ip_netmask.text is not None:
-            address_obj["type"] = "ip-netmask"
-            address_obj["value"] = ip_netmask.text
-        elif (ip_range := entry.find("ip-range")) is not None and ip_range.text is not None:
-            address_obj["type"] = "ip-range"
-            address_obj["value"] = ip_range.text
-        elif (fqdn := entry.find("fqdn")) is not None and fqdn.text is not None:
-            address_obj["type"] = "fqdn"
-            address_obj["value"] = fqdn.text
-        else:
-            address_obj["type"] = "unknown"
-            address_obj["value"] = ""
-
-        # Get description if available
-        description = entry.find("description")
-        if description is not None and description.text is not None:
-            address_obj["description"] = description.text
-
-        # Get tags if available
-        tags = []
-        tag_elements = entry.findall("tag/member")
-        if tag_elements:
-            for tag in tag_elements:
-                if tag.text:
-                    tags.append(tag.text)
-            if tags:
+        address_obj["type"] = "unknown"
+        address_obj["value"] = ""
+
+        # Read the type, value, description and tags in a single pass over the children
+        for child in entry:
+            if child.tag in _ADDRESS_TYPES and child.text:
+                address_obj["type"] = child.tag
+                address_obj["value"] = child.text
+            elif child.tag == "description" and child.text:
+                address_obj["description"] = child.text
+            elif child.tag == "tag" and (tags := [member.text for member in child.iterfind("member") if member.text]):
                 address_obj["tags"] = ", ".join(tags)
 
         return address_obj
@@ -315,98 +595,102 @@ class PanOSAPIClient:
     async def get_security_zones(self: "PanOSAPIClient") -> list[dict[str, str]]:
         """Get security zones configured on the firewall.
 
+        Results are cached for cache_ttl seconds; see invalidate().
+
         Returns:
             List of dictionaries containing security zone information.
 
         """
-        params = {"type": "config", "action": "get", "xpath": "/config/devices/entry/vsys/entry/zone"}
+        return await self._cached("security_zones", lambda: self._retry(self._fetch_security_zones))
 
-        root = await self._make_request(params)
-        entries = root.findall(".//entry")
+    async def _fetch_security_zones(self: "PanOSAPIClient") -> list[dict[str, str]]:
+        """Fetch security zones from the firewall, bypassing the cache.
+
+        Returns:
+            List of dictionaries containing security zone information.
 
+        """
+        root = await self._make_request(_SECURITY_ZONE_PARAMS)
         zones = []
-        for entry in entries:
-            zone = {"name": entry.get("name") or ""}
-
-            # Get zone type
-            if entry.find("network/layer3") is not None:
-                zone["type"] = "layer3"
-                interfaces = entry.findall(".//member")
-                zone["interfaces"] = ",".join([interface.text for interface in interfaces if interface.text])
-            elif entry.find("network/layer2") is not None:
-                zone["type"] = "layer2"
-                interfaces = entry.findall(".//member")
-                zone["interfaces"] = ",".join([interface.text for interface in interfaces if interface.text])
-            elif entry.find("network/virtual-wire") is not None:
-                zone["type"] = "virtual-wire"
-                interfaces = entry.findall(".//member")
-                zone["interfaces"] = ",".join([interface.text for interface in interfaces if interface.text])
-            elif entry.find("network/tap") is not None:
-                zone["type"] = "tap"
-                interfaces = entry.findall(".//member")
-                zone["interfaces"] = ",".join([interface.text for interface in interfaces if interface.text])
-            elif entry.find("network/external") is not None:
-                zone["type"] = "external"
-                zone["interfaces"] = ""
-            else:
-                zone["type"] = "unknown"
-                zone["interfaces"] = ""
+        for entry in root.iterfind("result/zone/entry"):
+            # A zone's type is the tag of the single child under <network>
+            zone = {"name": entry.get("name") or "", "type": "unknown", "interfaces": ""}
+            network = entry.find("network")
+            if network is not None:
+                for child in network:
+                    if child.tag in _ZONE_TYPES:
+                        zone["type"] = child.tag
+                        # External zone members are virtual systems, not interfaces
+                        if child.tag != "external":
+                            zone["interfaces"] = ",".join(filter(None, (member.text for member in child.iterfind("member"))))
+                        break
 
             zones.append(zone)
 
         return zones
 
-    async def get_security_policies(self: "PanOSAPIClient") -> list[dict[str, str]]:
+    async def get_security_policies(self: "PanOSAPIClient") -> list[SecurityPolicy]:
         """Get security policies configured on the firewall.
 
+        Results are cached for cache_ttl seconds; see invalidate().
+
         Returns:
-            List of dictionaries containing security policy information.
+            List of dictionaries containing security policy information. Zone, address,
+            application and service fields are lists of member names.
 
         """
-        params = {"type": "config", "action": "get", "xpath": "/config/devices/entry/vsys/entry/rulebase/security/rules"}
-
-        root = await self._make_request(params)
-        entries = root.findall(".//entry")
+        return await self._cached("security_policies", lambda: self._retry(self._fetch_security_policies))
 
-        policies = []
-        for entry in entries:
-            policy = {"name": entry.get("name") or ""}
+    async def _fetch_security_policies(self: "PanOSAPIClient") -> list[SecurityPolicy]:
+        """Fetch security policies from the firewall, bypassing the cache.
 
-            # Source information
-            source_zones = entry.findall(".//from/member")
-            policy["source_zones"] = ",".join([zone.text for zone in source_zones if zone.text])
-
-            source_addresses = entry.findall(".//source/member")
-            policy["source_addresses"] = ",".join([addr.text for addr in source_addresses if addr.text])
-
-            # Destination information
-            dest_zones = entry.findall(".//to/member")
-            policy["destination_zones"] = ",".join([zone.text for zone in dest_zones if zone.text])
-
-            dest_addresses = entry.findall(".//destination/member")
-            policy["destination_addresses"] = ",".join([addr.text for addr in dest_addresses if addr.text])
+        Returns:
+            List of dictionaries containing security policy information.
 
-            # Application and service information
-            applications = entry.findall(".//application/member")
-            policy["applications"] = ",".join([app.text for app in applications if app.text])
+        """
+        policies: list[SecurityPolicy] = []
+        async for entry in self._iter_entries(_SECURITY_POLICY_PARAMS, "rules"):
+            policies.append(
+                {
+                    "name": entry.get("name") or "",
+                    # Source information
+                    "source_zones": _POLICY_SOURCE_ZONES(entry),
+                    "source_addresses": _POLICY_SOURCE_ADDRESSES(entry),
+                    # Destination information
+                    "destination_zones": _POLICY_DESTINATION_ZONES(entry),
+                    "destination_addresses": _POLICY_DESTINATION_ADDRESSES(entry),
+                    # Application and service information
+                    "applications": _POLICY_APPLICATIONS(entry),
+                    "services": _POLICY_SERVICES(entry),
+                    # Action and description
+                    "action": _POLICY_ACTION(entry),
+                    "description": _POLICY_DESCRIPTION(entry),
+                }
+            )
 
-            services = entry.findall(".//service/member")
-            policy["services"] = ",".join([svc.text for svc in services if svc.text])
+        return policies
 
-            # Action
-            action = entry.find("action")
-            if action is not None and action.text is not None:
-                policy["action"] = action.text
-            else:
-                policy["action"] = ""
+    async def get_full_config(
+        self: "PanOSAPIClient",
+    ) -> tuple[
+        list[dict[str, str]] | BaseException,
+        list[dict[str, str]] | BaseException,
+        list[SecurityPolicy] | BaseException,
+    ]:
+        """Get address objects, security zones and security policies concurrently.
 
-            # Description
-            description = entry.find("description")
-            if description is not None and description.text is not None:
-                policy["description"] = description.text
-            else:
-                policy["description"] = ""
+        The three lookups are independent, so their requests are issued at the same
+        time instead of one after another. A failed lookup does not discard the others;
+        its exception is returned in its place.
 
-            policies.append(policy)
+        Returns:
+            Tuple of address objects, security zones and security policies, with the
+            raised exception in place of any lookup that failed.
 
-        return policies
+        """
+        return await asyncio.gather(
+            self.get_address_objects(),
+            self.get_security_zones(),
+            self.get_security_policies(),
+            return_exceptions=True,
+        )
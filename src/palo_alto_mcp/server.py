@@ -1,147 +1,414 @@
 """Palo Alto Networks MCP Server implementation using FastMCP."""
 
+import asyncio
 import logging
+import queue
+from collections.abc import Awaitable, Callable
+from logging.handlers import QueueHandler, QueueListener
+from typing import TypeVar
 
 from mcp.server.fastmcp import Context, FastMCP
 
 from palo_alto_mcp.config import get_settings
-from palo_alto_mcp.pan_os_api import PanOSAPIClient
+from palo_alto_mcp.pan_os_api import PanOSAPIClient, SecurityPolicy
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
+
+    dropped = 0
+
+    def prepare(self: "_DroppingQueueHandler", record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record to the listener unchanged, leaving all formatting to its handler.
+
+        The listener runs in this process, so the record does not need to be flattened
+        for pickling, and formatting it here as well would format every record twice.
+
+        Args:
+            record: The log record to enqueue.
+
+        Returns:
+            The same log record.
+
+        """
+        return record
+
+    def enqueue(self: "_DroppingQueueHandler", record: logging.LogRecord) -> None:
+        """Enqueue a record without blocking, counting it if the queue is full.
+
+        Args:
+            record: The log record to enqueue.
+
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _QueueListener(QueueListener):
+    """Queue listener whose shutdown waits for room in a full queue."""
+
+    def __init__(
+        self: "_QueueListener",
+        log_queue: queue.Queue[logging.LogRecord | None],
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+    ) -> None:
+        """Initialize the listener.
+
+        Args:
+            log_queue: The queue to read log records from.
+            *handlers: Handlers that write the records.
+            respect_handler_level: Only pass records to handlers whose level they meet.
+
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self._log_queue = log_queue
+
+    def enqueue_sentinel(self: "_QueueListener") -> None:
+        """Enqueue the stop sentinel (None), blocking until the queue has room."""
+        self._log_queue.put(None)
+
+
+def _start_log_listener(debug: bool) -> tuple[_QueueListener, _DroppingQueueHandler]:
+    """Configure logging and start the thread that writes log records to stderr.
+
+    Records are put on a bounded queue and written by a background thread, so tool
+    calls on the event loop never block on log I/O.
+
+    Args:
+        debug: Log at DEBUG level instead of INFO.
+
+    Returns:
+        The started listener and the queue handler installed on the root logger.
+
+    """
+    log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=10_000)
+    queue_handler = _DroppingQueueHandler(log_queue)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    logging.basicConfig(level=logging.DEBUG if debug else logging.INFO, handlers=[queue_handler], force=True)
+
+    listener = _QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener, queue_handler
+
+
+def _stop_log_listener(listener: _QueueListener, queue_handler: _DroppingQueueHandler) -> None:
+    """Flush queued log records and write any later ones to stderr directly.
+
+    Args:
+        listener: The listener returned by _start_log_listener.
+        queue_handler: The queue handler returned by _start_log_listener.
+
+    """
+    listener.stop()
+
+    # Nothing reads the queue any more, so hand the listener's handlers to the root logger
+    root = logging.getLogger()
+    root.removeHandler(queue_handler)
+    for handler in listener.handlers:
+        root.addHandler(handler)
+
+    if queue_handler.dropped:
+        logger.warning("Dropped %d log records because the log queue was full", queue_handler.dropped)
+
+
 # Create FastMCP instance
 mcp = FastMCP("PaloAltoMCPServer")
 
+# Shared API client, created on first use so every tool call reuses its connections and request limit
+_api_client: PanOSAPIClient | None = None
 
-@mcp.tool()
-async def show_system_info(ctx: Context) -> str:  # noqa: ARG001
-    """Get system information from the Palo Alto Networks firewall.
+
+def _get_api_client() -> PanOSAPIClient:
+    """Get the shared PanOSAPIClient, creating it on first use.
 
     Returns:
-        A formatted string containing system information.
+        The module-level PanOSAPIClient.
 
     """
-    logger.info("Retrieving system information")
+    global _api_client
+    if _api_client is None:
+        _api_client = PanOSAPIClient(get_settings())
+    return _api_client
 
-    try:
-        settings = get_settings()
-        logger.info(
-            f"Loaded PANOS_HOSTNAME={settings.panos_hostname}, PANOS_API_KEY={'set' if settings.panos_api_key else 'unset'}"
-        )
-        async with PanOSAPIClient(settings) as client:
-            system_info = await client.get_system_info()
-
-        # Format the system information as a readable string
-        formatted_info = "# Palo Alto Networks Firewall System Information\n\n"
-        for key, value in system_info.items():
-            formatted_info += f"**{key}**: {value}\n"
-
-        return formatted_info
-    except Exception as e:
-        error_msg = f"Error retrieving system information: {str(e)}"
-        logger.error(error_msg)
-        return f"Error: {error_msg}"
 
+def _format_system_info(system_info: dict[str, str]) -> str:
+    """Format system information as Markdown.
 
-@mcp.tool()
-async def retrieve_address_objects(ctx: Context) -> str:  # noqa: ARG001
-    """Get address objects configured on the Palo Alto Networks firewall.
+    Args:
+        system_info: System information as returned by PanOSAPIClient.get_system_info.
 
     Returns:
-        A formatted string containing address object information.
+        The Markdown for the system information.
 
     """
-    logger.info("Retrieving address objects")
+    parts = ["# Palo Alto Networks Firewall System Information\n\n"]
+    for key, value in system_info.items():
+        parts.append(f"**{key}**: {value}\n")
 
-    try:
-        settings = get_settings()
-        async with PanOSAPIClient(settings) as client:
-            address_objects = await client.get_address_objects()
+    return "".join(parts)
 
-        if not address_objects:
-            return "No address objects found on the firewall."
 
-        # Format the address objects as a readable string
-        formatted_output = "# Palo Alto Networks Firewall Address Objects\n\n"
+def _format_address_objects(address_objects: list[dict[str, str]]) -> str:
+    """Format address objects as Markdown, grouped by location.
 
-        # Group address objects by location for better organization
-        objects_by_location: dict[str, list[dict[str, str]]] = {}
-        for obj in address_objects:
-            location = obj.get("location", "Unknown")
-            if location not in objects_by_location:
-                objects_by_location[location] = []
-            objects_by_location[location].append(obj)
+    Args:
+        address_objects: Address objects as returned by PanOSAPIClient.get_address_objects.
 
-        # Display objects grouped by location
-        for location, objects in objects_by_location.items():
-            formatted_output += f"## {location.capitalize()} Address Objects\n\n"
+    Returns:
+        The Markdown for the address objects.
 
-            for obj in objects:
-                formatted_output += f"### {obj['name']}\n"
-                formatted_output += f"- **Type**: {obj.get('type', 'N/A')}\n"
-                formatted_output += f"- **Value**: {obj.get('value', 'N/A')}\n"
+    """
+    if not address_objects:
+        return "No address objects found on the firewall."
 
-                if "description" in obj:
-                    formatted_output += f"- **Description**: {obj['description']}\n"
+    # Format the address objects as a readable string
+    parts = ["# Palo Alto Networks Firewall Address Objects\n\n"]
 
-                if "tags" in obj:
-                    formatted_output += f"- **Tags**: {obj['tags']}\n"
+    # Group address objects by location for better organization
+    objects_by_location: dict[str, list[dict[str, str]]] = {}
+    for obj in address_objects:
+        location = obj.get("location", "Unknown")
+        if location not in objects_by_location:
+            objects_by_location[location] = []
+        objects_by_location[location].append(obj)
 
-                formatted_output += "\n"
+    # Display objects grouped by location
+    for location, objects in objects_by_location.items():
+        parts.append(f"## {location.capitalize()} Address Objects\n\n")
 
-        return formatted_output
-    except Exception as e:
-        error_msg = f"Error retrieving address objects: {str(e)}"
+        for obj in objects:
+            parts.append(f"### {obj['name']}\n")
+            parts.append(f"- **Type**: {obj.get('type', 'N/A')}\n")
+            parts.append(f"- **Value**: {obj.get('value', 'N/A')}\n")
+
+            if "description" in obj:
+                parts.append(f"- **Description**: {obj['description']}\n")
+
+            if "tags" in obj:
+                parts.append(f"- **Tags**: {obj['tags']}\n")
+
+            parts.append("\n")
+
+    return "".join(parts)
+
+
+def _format_security_zones(zones: list[dict[str, str]]) -> str:
+    """Format security zones as Markdown.
+
+    Args:
+        zones: Security zones as returned by PanOSAPIClient.get_security_zones.
+
+    Returns:
+        The Markdown for the security zones.
+
+    """
+    if not zones:
+        return "No security zones found on the firewall."
+
+    # Format the security zones as a readable string
+    parts = ["# Palo Alto Networks Firewall Security Zones\n\n"]
+    for zone in zones:
+        parts.append(f"## {zone['name']}\n")
+        parts.append(f"- **Type**: {zone.get('type', 'N/A')}\n")
+
+        if "interfaces" in zone and zone["interfaces"]:
+            parts.append("- **Interfaces**:\n")
+            for interface in zone["interfaces"].split(","):
+                if interface:
+                    parts.append(f"  - {interface}\n")
+        else:
+            parts.append("- **Interfaces**: None\n")
+
+        parts.append("\n")
+
+    return "".join(parts)
+
+
+def _format_security_policies(policies: list[SecurityPolicy]) -> str:
+    """Format security policies as Markdown.
+
+    Args:
+        policies: Security policies as returned by PanOSAPIClient.get_security_policies.
+
+    Returns:
+        The Markdown for the security policies.
+
+    """
+    if not policies:
+        return "No security policies found on the firewall."
+
+    # Format the security policies as a readable string
+    parts = ["# Palo Alto Networks Firewall Security Policies\n\n"]
+    parts.extend(_render_policy(policy) for policy in policies)
+
+    return "".join(parts)
+
+
+def _format_full_config(
+    config: tuple[
+        list[dict[str, str]] | BaseException,
+        list[dict[str, str]] | BaseException,
+        list[SecurityPolicy] | BaseException,
+    ],
+) -> str:
+    """Format the full configuration as Markdown.
+
+    Args:
+        config: Address objects, security zones and security policies as returned by
+            PanOSAPIClient.get_full_config, each of which may be the exception that
+            its lookup raised.
+
+    Returns:
+        The address object, security zone and security policy sections, one after another,
+        with an error line in place of each section that could not be retrieved.
+
+    """
+    address_objects, zones, policies = config
+    return "\n".join(
+        [
+            _format_section("address objects", address_objects, _format_address_objects),
+            _format_section("security zones", zones, _format_security_zones),
+            _format_section("security policies", policies, _format_security_policies),
+        ]
+    )
+
+
+def _format_section(description: str, result: T | BaseException, render: Callable[[T], str]) -> str:
+    """Format one section of the full configuration, or an error line if its lookup failed.
+
+    Args:
+        description: What the section contains, used in the error message.
+        result: The lookup result, or the exception it raised.
+        render: Function that formats the result as Markdown.
+
+    Returns:
+        The rendered Markdown, or an error message if the lookup failed.
+
+    """
+    if isinstance(result, BaseException):
+        error_msg = f"Error retrieving {description}: {str(result)}"
         logger.error(error_msg)
         return f"Error: {error_msg}"
+    return render(result)
 
 
-@mcp.tool()
-async def retrieve_security_zones(ctx: Context) -> str:  # noqa: ARG001
-    """Get security zones configured on the Palo Alto Networks firewall.
+def _render_policy(policy: SecurityPolicy) -> str:
+    """Render a security policy as a Markdown section.
+
+    Args:
+        policy: Security policy dictionary as returned by PanOSAPIClient.get_security_policies.
 
     Returns:
-        A formatted string containing security zone information.
+        The Markdown for the policy, ending with a blank line.
 
     """
-    logger.info("Retrieving security zones")
+    description = f"- **Description**: {policy['description']}\n" if policy.get("description") else ""
+    return (
+        f"## {policy['name']}\n"
+        f"{description}"
+        f"- **Action**: {policy.get('action', 'N/A')}\n"
+        f"- **Source Zones**:\n{_render_members(policy['source_zones'])}"
+        f"- **Source Addresses**:\n{_render_members(policy['source_addresses'])}"
+        f"- **Destination Zones**:\n{_render_members(policy['destination_zones'])}"
+        f"- **Destination Addresses**:\n{_render_members(policy['destination_addresses'])}"
+        f"- **Applications**:\n{_render_members(policy['applications'])}"
+        f"- **Services**:\n{_render_members(policy['services'])}"
+        "\n"
+    )
+
+
+def _render_members(members: list[str]) -> str:
+    """Render member names as an indented Markdown list.
+
+    Args:
+        members: The member names to render.
+
+    Returns:
+        One indented list item per member.
+
+    """
+    return "".join([f"  - {member}\n" for member in members])
+
+
+async def _run_tool(description: str, fetch: Callable[[], Awaitable[T]], render: Callable[[T], str]) -> str:
+    """Fetch data for a tool and render it, turning any failure into an error message.
+
+    Args:
+        description: What is being retrieved, used in log and error messages.
+        fetch: Coroutine function that retrieves the data.
+        render: Function that formats the data as Markdown.
+
+    Returns:
+        The rendered Markdown, or an error message if retrieval failed.
+
+    """
+    logger.info("Retrieving %s", description)
 
     try:
-        settings = get_settings()
-        async with PanOSAPIClient(settings) as client:
-            zones = await client.get_security_zones()
-
-        if not zones:
-            return "No security zones found on the firewall."
-
-        # Format the security zones as a readable string
-        formatted_output = "# Palo Alto Networks Firewall Security Zones\n\n"
-        for zone in zones:
-            formatted_output += f"## {zone['name']}\n"
-            formatted_output += f"- **Type**: {zone.get('type', 'N/A')}\n"
-
-            if "interfaces" in zone and zone["interfaces"]:
-                formatted_output += "- **Interfaces**:\n"
-                for interface in zone["interfaces"].split(","):
-                    if interface:
-                        formatted_output += f"  - {interface}\n"
-            else:
-                formatted_output += "- **Interfaces**: None\n"
-
-            formatted_output += "\n"
-
-        return formatted_output
+        return render(await fetch())
     except Exception as e:
-        error_msg = f"Error retrieving security zones: {str(e)}"
+        error_msg = f"Error retrieving {description}: {str(e)}"
         logger.error(error_msg)
         return f"Error: {error_msg}"
 
 
+async def _fetch_system_info() -> dict[str, str]:
+    """Fetch system information, logging which connection settings are in use.
+
+    Returns:
+        Dictionary containing system information.
+
+    """
+    settings = get_settings()
+    logger.info(
+        "Loaded PANOS_HOSTNAME=%s, PANOS_API_KEY=%s",
+        settings.panos_hostname,
+        "set" if settings.panos_api_key else "unset",
+    )
+    return await _get_api_client().get_system_info()
+
+
+@mcp.tool()
+async def show_system_info(ctx: Context) -> str:  # noqa: ARG001
+    """Get system information from the Palo Alto Networks firewall.
+
+    Returns:
+        A formatted string containing system information.
+
+    """
+    return await _run_tool("system information", _fetch_system_info, _format_system_info)
+
+
+@mcp.tool()
+async def retrieve_address_objects(ctx: Context) -> str:  # noqa: ARG001
+    """Get address objects configured on the Palo Alto Networks firewall.
+
+    Returns:
+        A formatted string containing address object information.
+
+    """
+    return await _run_tool("address objects", lambda: _get_api_client().get_address_objects(), _format_address_objects)
+
+
+@mcp.tool()
+async def retrieve_security_zones(ctx: Context) -> str:  # noqa: ARG001
+    """Get security zones configured on the Palo Alto Networks firewall.
+
+    Returns:
+        A formatted string containing security zone information.
+
+    """
+    return await _run_tool("security zones", lambda: _get_api_client().get_security_zones(), _format_security_zones)
+
+
 @mcp.tool()
 async def retrieve_security_policies(ctx: Context) -> str:  # noqa: ARG001
     """Get security policies configured on the Palo Alto Networks firewall.
@@ -150,63 +417,47 @@ async def retrieve_security_policies(ctx: Context) -> str:  # noqa: ARG001
         A formatted string containing security policy information.
 
     """
-    logger.info("Retrieving security policies")
-
-    try:
-        settings = get_settings()
-        async with PanOSAPIClient(settings) as client:
-            policies = await client.get_security_policies()
+    return await _run_tool("security policies", lambda: _get_api_client().get_security_policies(), _format_security_policies)
 
-        if not policies:
-            return "No security policies found on the firewall."
 
-        # Format the security policies as a readable string
-        formatted_output = "# Palo Alto Networks Firewall Security Policies\n\n"
-        for policy in policies:
-            formatted_output += f"## {policy['name']}\n"
-
-            if "description" in policy and policy["description"]:
-                formatted_output += f"- **Description**: {policy['description']}\n"
+@mcp.tool()
+async def retrieve_full_config(ctx: Context) -> str:  # noqa: ARG001
+    """Get address objects, security zones and security policies in a single call.
 
-            formatted_output += f"- **Action**: {policy.get('action', 'N/A')}\n"
+    The three lookups are sent to the firewall concurrently, so this is faster
+    than calling the individual retrieve tools one after another.
 
-            formatted_output += "- **Source Zones**:\n"
-            for zone in policy.get("source_zones", "").split(","):
-                if zone:
-                    formatted_output += f"  - {zone}\n"
+    Returns:
+        A formatted string containing address object, security zone and security policy information.
 
-            formatted_output += "- **Source Addresses**:\n"
-            for addr in policy.get("source_addresses", "").split(","):
-                if addr:
-                    formatted_output += f"  - {addr}\n"
+    """
+    return await _run_tool("full configuration", lambda: _get_api_client().get_full_config(), _format_full_config)
 
-            formatted_output += "- **Destination Zones**:\n"
-            for zone in policy.get("destination_zones", "").split(","):
-                if zone:
-                    formatted_output += f"  - {zone}\n"
 
-            formatted_output += "- **Destination Addresses**:\n"
-            for addr in policy.get("destination_addresses", "").split(","):
-                if addr:
-                    formatted_output += f"  - {addr}\n"
+async def _serve() -> None:
+    """Serve the MCP server over SSE, closing the shared API client when it stops."""
+    try:
+        await mcp.run_sse_async()
+    finally:
+        # Closed on the loop that created it, releasing its pooled connections
+        if _api_client is not None:
+            await _api_client.close()
 
-            formatted_output += "- **Applications**:\n"
-            for app in policy.get("applications", "").split(","):
-                if app:
-                    formatted_output += f"  - {app}\n"
 
-            formatted_output += "- **Services**:\n"
-            for svc in policy.get("services", "").split(","):
-                if svc:
-                    formatted_output += f"  - {svc}\n"
+def _run_serve() -> None:
+    """Run _serve() on uvloop if it is installed, otherwise on the default asyncio event loop.
 
-            formatted_output += "\n"
+    FastMCP serves on whichever loop is already running, so uvicorn's loop="auto" never gets
+    to choose uvloop; the loop has to be picked here.
 
-        return formatted_output
-    except Exception as e:
-        error_msg = f"Error retrieving security policies: {str(e)}"
-        logger.error(error_msg)
-        return f"Error: {error_msg}"
+    """
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is not available on Windows
+        asyncio.run(_serve())
+    else:
+        uvloop.run(_serve())
 
 
 def main() -> None:
@@ -214,9 +465,13 @@ def main() -> None:
     Run the MCP server as a network server with SSE endpoints.
     Exposes /sse and /messages/ endpoints for Windsurf and MCP clients.
     """
-    get_settings()
-    logger.info("Starting Palo Alto Networks MCP Server")
-    mcp.run(transport="sse")
+    settings = get_settings()
+    listener, queue_handler = _start_log_listener(settings.debug)
+    try:
+        logger.info("Starting Palo Alto Networks MCP Server")
+        _run_serve()
+    finally:
+        _stop_log_listener(listener, queue_handler)
 
 
 if __name__ == "__main__":
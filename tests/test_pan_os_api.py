@@ -0,0 +1,274 @@
+"""Tests for the PAN-OS XML API client, run against httpx mock transports."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from lxml import etree
+
+from palo_alto_mcp import pan_os_api
+from palo_alto_mcp.config import Settings
+from palo_alto_mcp.pan_os_api import PanOSAPIClient
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture(autouse=True)
+def _isolate(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with an empty cache and no retry backoff."""
+    pan_os_api.invalidate()
+    monkeypatch.setattr(pan_os_api, "RETRY_BASE_DELAY", 0)
+
+
+def _make_client(handler: Handler, cache_ttl: float = 60.0) -> PanOSAPIClient:
+    """Create a client whose requests are answered by handler."""
+    settings = Settings(panos_hostname="fw.example.com", panos_api_key="test-key", cache_ttl=cache_ttl)
+    return PanOSAPIClient(settings, transport=httpx.MockTransport(handler))
+
+
+def _fixture(name: str) -> bytes:
+    """Read a captured XML API response."""
+    return (FIXTURES / name).read_bytes()
+
+
+async def _chunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    """Yield body a few bytes at a time, as a slow connection would deliver it."""
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+async def _entry_names(client: PanOSAPIClient, container_tag: str) -> list[str]:
+    """Stream a response and collect the names of its entries."""
+    return [entry.get("name") or "" async for entry in client._iter_entries({"type": "config"}, container_tag)]
+
+
+def test_iter_entries_parses_small_chunks() -> None:
+    """Entries split across many small chunks are still yielded whole and in order."""
+    body = _fixture("security_rules.xml")
+    client = _make_client(lambda _request: httpx.Response(200, content=_chunks(body, 7)))
+
+    assert asyncio.run(_entry_names(client, "rules")) == ["allow-web", "deny-all"]
+
+
+def test_iter_entries_raises_api_error_message() -> None:
+    """An error response is raised as a ValueError carrying the API's <msg> text."""
+    body = b'<response status="error" code="403"><result><msg>Invalid credentials.</msg></result></response>'
+    client = _make_client(lambda _request: httpx.Response(200, content=_chunks(body, 5)))
+
+    with pytest.raises(ValueError, match="API error: Invalid credentials."):
+        asyncio.run(_entry_names(client, "rules"))
+
+
+def test_iter_entries_raises_on_truncated_xml() -> None:
+    """A response cut off mid-document is reported as a parse error."""
+    body = _fixture("security_rules.xml")
+    body = body[: body.index(b"<entry", body.index(b"</entry>"))] + b"<entry name="
+    client = _make_client(lambda _request: httpx.Response(200, content=body))
+
+    with pytest.raises(ValueError, match="Failed to parse XML response"):
+        asyncio.run(_entry_names(client, "rules"))
+
+
+def test_iter_entries_raises_on_empty_body() -> None:
+    """An empty body is an error rather than an empty result."""
+    client = _make_client(lambda _request: httpx.Response(200, content=b""))
+
+    with pytest.raises(ValueError):
+        asyncio.run(_entry_names(client, "rules"))
+
+
+def test_cached_result_expires_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lookups are served from the cache until the TTL passes, then fetched again."""
+    requests = []
+    now = [1000.0]
+    monkeypatch.setattr(pan_os_api, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=_fixture("security_zones.xml"))
+
+    client = _make_client(handler, cache_ttl=30.0)
+
+    async def lookup() -> None:
+        await client.get_security_zones()
+        await client.get_security_zones()
+        assert len(requests) == 1
+
+        now[0] += 29.0
+        await client.get_security_zones()
+        assert len(requests) == 1
+
+        now[0] += 2.0
+        await client.get_security_zones()
+        assert len(requests) == 2
+
+    asyncio.run(lookup())
+
+
+def test_invalidate_drops_cached_results() -> None:
+    """invalidate() forces the next lookup to go to the firewall."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=_fixture("security_zones.xml"))
+
+    client = _make_client(handler)
+
+    async def lookup() -> None:
+        await client.get_security_zones()
+        pan_os_api.invalidate("other.example.com")
+        await client.get_security_zones()
+        assert len(requests) == 1
+
+        pan_os_api.invalidate("fw.example.com")
+        await client.get_security_zones()
+        assert len(requests) == 2
+
+        pan_os_api.invalidate()
+        await client.get_security_zones()
+        assert len(requests) == 3
+
+    asyncio.run(lookup())
+
+
+def test_failed_address_lookup_is_not_cached() -> None:
+    """A lookup that fails is fetched again once the firewall recovers."""
+    healthy = [False]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if not healthy[0]:
+            return httpx.Response(500)
+        if request.url.params["xpath"].endswith("/device-group"):
+            return httpx.Response(200, content=_fixture("device_groups.xml"))
+        return httpx.Response(200, content=b'<response status="success"><result/></response>')
+
+    client = _make_client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.get_address_objects())
+
+    healthy[0] = True
+    address_objects = asyncio.run(client.get_address_objects())
+    assert [obj["name"] for obj in address_objects] == ["branch-dns", "branch-proxy", "dc-servers"]
+
+
+def test_retry_retries_server_errors() -> None:
+    """5xx responses are retried until one succeeds."""
+    statuses = [503, 502]
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        if statuses:
+            return httpx.Response(statuses.pop(0))
+        return httpx.Response(200, content=_fixture("security_zones.xml"))
+
+    client = _make_client(handler)
+
+    zones = asyncio.run(client.get_security_zones())
+    assert [zone["name"] for zone in zones] == ["trust", "untrust", "to-vsys2"]
+    assert not statuses
+
+
+def test_retry_gives_up_after_last_attempt() -> None:
+    """A server error on every attempt is raised once the attempts run out."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(500)
+
+    client = _make_client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.get_security_zones())
+    assert len(requests) == pan_os_api.RETRY_ATTEMPTS
+
+
+def test_retry_raises_client_errors_immediately() -> None:
+    """4xx responses are not retried."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(403)
+
+    client = _make_client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.get_security_zones())
+    assert len(requests) == 1
+
+
+def test_client_is_usable_from_a_new_event_loop() -> None:
+    """The same instance keeps working when each call runs on its own event loop."""
+    client = _make_client(lambda _request: httpx.Response(200, content=_fixture("security_zones.xml")), cache_ttl=0)
+
+    for _ in range(2):
+        assert len(asyncio.run(client.get_security_zones())) == 3
+
+
+def test_device_group_address_objects_skip_nested_entries(caplog: pytest.LogCaptureFixture) -> None:
+    """Only device groups are read as device groups, and each group's addresses carry its location."""
+    caplog.set_level(logging.INFO, logger="palo_alto_mcp.pan_os_api")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["xpath"].endswith("/device-group"):
+            return httpx.Response(200, content=_fixture("device_groups.xml"))
+        return httpx.Response(200, content=b'<response status="success"><result/></response>')
+
+    client = _make_client(handler)
+
+    assert asyncio.run(client.get_address_objects()) == [
+        {
+            "name": "branch-dns",
+            "location": "device-group:branch-offices",
+            "type": "ip-netmask",
+            "value": "10.10.0.53/32",
+            "description": "Branch DNS resolver",
+        },
+        {
+            "name": "branch-proxy",
+            "location": "device-group:branch-offices",
+            "type": "fqdn",
+            "value": "proxy.branch.example.com",
+            "tags": "proxy",
+        },
+        {
+            "name": "dc-servers",
+            "location": "device-group:datacenter",
+            "type": "ip-range",
+            "value": "172.16.0.10-172.16.0.50",
+        },
+    ]
+    # The fixture nests device and address entries inside each device group; they are not groups themselves
+    assert "Found 2 device groups" in caplog.messages
+
+
+def test_security_zones_list_only_network_interfaces() -> None:
+    """Zone interfaces come from the zone's network type, not from other member lists in the entry."""
+    client = _make_client(lambda _request: httpx.Response(200, content=_fixture("security_zones.xml")))
+
+    assert asyncio.run(client.get_security_zones()) == [
+        {"name": "trust", "type": "layer3", "interfaces": "ethernet1/2,ethernet1/3"},
+        {"name": "untrust", "type": "layer3", "interfaces": "ethernet1/1"},
+        {"name": "to-vsys2", "type": "external", "interfaces": ""},
+    ]
+
+
+def test_policy_paths_match_descendant_lookups() -> None:
+    """The compiled policy paths return the same members as the old descendant lookups."""
+    root = etree.fromstring(_fixture("security_rules.xml"))
+    entries = root.findall("result/rules/entry")
+
+    assert len(entries) == len(root.findall(".//entry")) == 2
+    for entry in entries:
+        assert pan_os_api._POLICY_SOURCE_ZONES(entry) == [m.text for m in entry.findall(".//from/member")]
+        assert pan_os_api._POLICY_DESTINATION_ZONES(entry) == [m.text for m in entry.findall(".//to/member")]
+        assert pan_os_api._POLICY_APPLICATIONS(entry) == [m.text for m in entry.findall(".//application/member")]
+        assert pan_os_api._POLICY_SERVICES(entry) == [m.text for m in entry.findall(".//service/member")]
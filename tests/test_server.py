@@ -0,0 +1,93 @@
+"""Tests for the MCP server's formatting and logging helpers."""
+
+import logging
+import queue
+
+from palo_alto_mcp import server
+from palo_alto_mcp.pan_os_api import SecurityPolicy
+
+POLICY: SecurityPolicy = {
+    "name": "allow-web",
+    "source_zones": ["trust"],
+    "source_addresses": ["any"],
+    "destination_zones": ["untrust", "dmz"],
+    "destination_addresses": ["any"],
+    "applications": ["ssl", "web-browsing"],
+    "services": ["application-default"],
+    "action": "allow",
+    "description": "Outbound web access",
+}
+
+
+def test_render_policy_lists_each_member() -> None:
+    """Each member of a list-typed field is rendered as its own list item."""
+    assert server._render_policy(POLICY) == (
+        "## allow-web\n"
+        "- **Description**: Outbound web access\n"
+        "- **Action**: allow\n"
+        "- **Source Zones**:\n"
+        "  - trust\n"
+        "- **Source Addresses**:\n"
+        "  - any\n"
+        "- **Destination Zones**:\n"
+        "  - untrust\n"
+        "  - dmz\n"
+        "- **Destination Addresses**:\n"
+        "  - any\n"
+        "- **Applications**:\n"
+        "  - ssl\n"
+        "  - web-browsing\n"
+        "- **Services**:\n"
+        "  - application-default\n"
+        "\n"
+    )
+
+
+def test_render_policy_skips_empty_description_and_members() -> None:
+    """An empty description is left out, and a field without members has no items."""
+    policy: SecurityPolicy = {**POLICY, "description": "", "source_addresses": []}
+
+    rendered = server._render_policy(policy)
+
+    assert "Description" not in rendered
+    assert "- **Source Addresses**:\n- **Destination Zones**:\n" in rendered
+
+
+def test_format_full_config_renders_error_for_failed_section() -> None:
+    """A failed lookup is replaced by an error line while the other sections are still rendered."""
+    address_objects = [{"name": "web-server", "type": "ip-netmask", "value": "10.0.0.10/32", "location": "shared"}]
+
+    rendered = server._format_full_config((address_objects, ValueError("API error: timed out"), [POLICY]))
+
+    assert "### web-server" in rendered
+    assert "Error: Error retrieving security zones: API error: timed out" in rendered
+    assert "## allow-web" in rendered
+    assert "Security Zones" not in rendered
+
+
+def test_format_section_renders_result_or_error() -> None:
+    """A result is passed to the renderer, and an exception becomes an error line."""
+    assert server._format_section("zones", ["trust"], ", ".join) == "trust"
+    assert server._format_section("zones", OSError("unreachable"), ", ".join) == "Error: Error retrieving zones: unreachable"
+
+
+def test_dropping_queue_handler_counts_dropped_records() -> None:
+    """Records that do not fit in the queue are counted instead of blocking the caller."""
+    log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=2)
+    handler = server._DroppingQueueHandler(log_queue)
+    logger = logging.getLogger("tests.dropping_queue_handler")
+    logger.propagate = False
+    logger.addHandler(handler)
+
+    try:
+        for i in range(5):
+            logger.warning("record %d", i)
+    finally:
+        logger.removeHandler(handler)
+
+    assert handler.dropped == 3
+    assert log_queue.qsize() == 2
+    # Records are queued unformatted, so the listener's handler formats each one only once
+    record = log_queue.get_nowait()
+    assert record is not None
+    assert (record.msg, record.args) == ("record %d", (0,))